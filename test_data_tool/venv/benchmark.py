@@ -0,0 +1,183 @@
+"""
+Benchmark suite for data_generator.
+
+Runs every field on its own, all fields together, and the Address/Phone locales,
+reporting rows/sec, per-field time per value and peak memory for each case.
+Results are compared against a JSON baseline and regressions are flagged.
+
+    python benchmark.py                          # run and compare against the baseline
+    python benchmark.py --save-baseline          # run and store the results as the new baseline
+    python benchmark.py --rows 1000 100000       # override the row counts
+"""
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import json
+import os
+import sys
+import time
+
+from data_generator import COUNTRY_LOCALES, iter_data
+
+FIELDS = ["Hobbies", "Age", "Gender", "Address", "Phone", "Email", "Education", "Pets", "Random Strings"]
+ROW_COUNTS = [1000, 100000, 1000000]
+LOCALE_FIELDS = ["Address", "Phone"]
+
+BASELINE_FILE = "benchmark_baseline.json"
+
+# Allowed slowdown in rows/sec and growth in peak memory before a case counts as a regression
+TOLERANCE = 0.2
+
+def peak_memory_bytes():
+    """
+    Return the peak resident memory of the current process, or None where it cannot be read.
+    """
+    try:
+        import resource
+    except ImportError:
+        resource = None
+
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024  # Kilobytes everywhere but macOS
+
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize
+
+    return None
+
+def run_case(fields, constraints, num_rows):
+    """
+    Stream `num_rows` rows without keeping them and measure throughput, per-field cost and peak memory.
+    """
+    # Warm up so imports and Faker instances are not part of the measurement
+    for _ in iter_data(fields, constraints, 10):
+        pass
+
+    timings = {}
+    started = time.perf_counter()
+    for _ in iter_data(fields, constraints, num_rows, timings=timings):
+        pass
+    seconds = time.perf_counter() - started
+
+    return {
+        "rows": num_rows,
+        "seconds": seconds,
+        "rows_per_sec": num_rows / seconds if seconds else None,
+        "field_us_per_value": {
+            field: 1e6 * counters["seconds"] / counters["values"]
+            for field, counters in timings.items()
+            if counters["values"]
+        },
+        "peak_memory_bytes": peak_memory_bytes(),
+    }
+
+def build_cases(row_counts, locale_rows):
+    """
+    Return (name, fields, constraints, rows) for every benchmark case.
+    """
+    cases = []
+    for num_rows in row_counts:
+        for field in FIELDS:
+            cases.append((f"{field} x{num_rows}", [field], {}, num_rows))
+        cases.append((f"All fields x{num_rows}", FIELDS, {}, num_rows))
+
+    for country, locale in COUNTRY_LOCALES.items():
+        for field in LOCALE_FIELDS:
+            constraint = f"Country: {country.title()}"
+            cases.append((f"{field} {locale} x{locale_rows}", [field], {field: constraint}, locale_rows))
+    return cases
+
+def run_suite(cases):
+    """
+    Run each case in a fresh process so peak memory and caches are not shared between cases.
+    """
+    results = {}
+    for name, fields, constraints, num_rows in cases:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            result = pool.submit(run_case, fields, constraints, num_rows).result()
+        results[name] = result
+        print(format_result(name, result), flush=True)
+    return results
+
+def format_result(name, result):
+    memory = result["peak_memory_bytes"]
+    memory_text = f"{memory / (1024 * 1024):8.1f} MB" if memory is not None else "     n/a"
+    fields_text = ", ".join(f"{field} {us:.1f}us" for field, us in result["field_us_per_value"].items())
+    return f"{name:<32} {result['rows_per_sec']:>12,.0f} rows/s  {memory_text}  [{fields_text}]"
+
+def find_regressions(results, baseline, tolerance=TOLERANCE):
+    """
+    Compare results with a baseline, returning a message for each case that got slower or bigger.
+    """
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+
+        if previous.get("rows_per_sec") and result["rows_per_sec"] < previous["rows_per_sec"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result['rows_per_sec']:,.0f} rows/s, baseline {previous['rows_per_sec']:,.0f} rows/s"
+            )
+
+        memory, previous_memory = result["peak_memory_bytes"], previous.get("peak_memory_bytes")
+        if memory and previous_memory and memory > previous_memory * (1 + tolerance):
+            regressions.append(
+                f"{name}: peak memory {memory / (1024 * 1024):.1f} MB, "
+                f"baseline {previous_memory / (1024 * 1024):.1f} MB"
+            )
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark data_generator.")
+    parser.add_argument("--rows", type=int, nargs="+", default=ROW_COUNTS, help="row counts to benchmark")
+    parser.add_argument("--locale-rows", type=int, default=ROW_COUNTS[0], help="row count for the locale cases")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="allowed relative regression")
+    args = parser.parse_args()
+
+    results = run_suite(build_cases(args.rows, args.locale_rows))
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=4)
+        print(f"Saved baseline to '{args.baseline}'.")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline found at '{args.baseline}'; run with --save-baseline to create one.")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = find_regressions(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print("No regressions against the baseline.")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
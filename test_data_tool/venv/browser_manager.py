@@ -0,0 +1,164 @@
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+import queue
+import threading
+import time
+
+def setup_browser(chrome_driver_path, headless=False):
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    service = Service(chrome_driver_path)
+    driver = webdriver.Chrome(service=service, options=options)
+    if not headless:
+        driver.maximize_window()
+    return driver
+
+def is_healthy(driver):
+    """
+    Return True if the browser session still answers commands.
+    """
+    try:
+        driver.execute_script("return document.readyState")
+        return True
+    except Exception:
+        return False
+
+class DriverPool:
+    """
+    Fixed number of reusable browser sessions, handed out to one thread at a time.
+
+    Sessions are started on first use, health-checked whenever they are acquired, and
+    recycled (quit and replaced) after a failure or after `max_uses` rows.
+    `driver_factory` creates a session, e.g. `lambda: setup_browser(path, headless=True)`.
+    """
+
+    def __init__(self, driver_factory, size=4, max_uses=100):
+        self.driver_factory = driver_factory
+        self.size = size
+        self.max_uses = max_uses
+        self.created = 0
+        self.recycled = 0
+        self.lock = threading.Lock()
+        self.idle = queue.Queue()
+        for _ in range(size):
+            self.idle.put({"driver": None, "uses": 0})
+
+    def acquire(self):
+        session = self.idle.get()
+        if session["driver"] is not None and not is_healthy(session["driver"]):
+            self.discard(session)
+        if session["driver"] is None:
+            try:
+                session["driver"] = self.driver_factory()
+            except Exception:
+                self.idle.put(session)
+                raise
+            with self.lock:
+                self.created += 1
+        return session
+
+    def release(self, session, failed=False):
+        session["uses"] += 1
+        if failed or session["uses"] >= self.max_uses:
+            self.discard(session)
+        self.idle.put(session)
+
+    def discard(self, session):
+        try:
+            session["driver"].quit()
+        except Exception:
+            pass  # The session is being replaced because it is broken
+        session["driver"] = None
+        session["uses"] = 0
+        with self.lock:
+            self.recycled += 1
+
+    def close(self):
+        for _ in range(self.size):
+            session = self.idle.get()
+            if session["driver"] is not None:
+                try:
+                    session["driver"].quit()
+                except Exception:
+                    pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def fill_form(driver, url, row, selectors, submit_selector=None):
+    """
+    Open `url` and type each row value into the element matching its field's CSS selector.
+    """
+    driver.get(url)
+    for field, selector in selectors.items():
+        if field not in row:
+            continue
+        element = driver.find_element(By.CSS_SELECTOR, selector)
+        element.clear()
+        element.send_keys(str(row[field]))
+
+    if submit_selector:
+        driver.find_element(By.CSS_SELECTOR, submit_selector).click()
+
+def fill_row(pool, url, row, selectors, submit_selector=None, retries=1):
+    """
+    Fill the form for one row with a pooled session, retrying on a fresh session after a failure.
+    """
+    started = time.perf_counter()
+    error = None
+    for attempt in range(1, retries + 2):
+        try:
+            session = pool.acquire()
+        except Exception as e:
+            error = f"Could not start browser: {e}"
+            continue
+
+        try:
+            fill_form(session["driver"], url, row, selectors, submit_selector)
+        except Exception as e:
+            pool.release(session, failed=True)
+            error = str(e)
+            continue
+
+        pool.release(session)
+        return {"ok": True, "error": None, "attempts": attempt, "seconds": time.perf_counter() - started}
+
+    return {"ok": False, "error": error, "attempts": retries + 1, "seconds": time.perf_counter() - started}
+
+def fill_forms(rows, url, selectors, pool, submit_selector=None, retries=1):
+    """
+    Fill the form at `url` once per row, spreading rows over the pool's sessions in parallel.
+
+    `rows` can be any iterable of row dicts, such as `iter_rows(...)` from data_generator;
+    it is consumed through a bounded queue so large jobs are not held in memory.
+    `selectors` maps field names to CSS selectors. Returns one result per row, in row order:
+    {"row": index, "ok": bool, "error": message or None, "attempts": int, "seconds": float}.
+    """
+    tasks = queue.Queue(maxsize=pool.size * 2)
+    results = {}
+
+    def worker():
+        while (task := tasks.get()) is not None:
+            index, row = task
+            result = fill_row(pool, url, row, selectors, submit_selector, retries)
+            results[index] = {"row": index, **result}
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(pool.size)]
+    for thread in threads:
+        thread.start()
+    try:
+        for task in enumerate(rows):
+            tasks.put(task)
+    finally:
+        for _ in threads:
+            tasks.put(None)
+        for thread in threads:
+            thread.join()
+
+    return [results[index] for index in sorted(results)]
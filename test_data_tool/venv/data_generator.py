@@ -0,0 +1,830 @@
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from itertools import islice
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import string
+import sys
+import threading
+import time
+
+# Number of rows generated per batch; columns are filled this many values at a time
+BATCH_SIZE = 10000
+
+# Map user input to Faker locales; add a country here to support it in Address and Phone constraints
+COUNTRY_LOCALES = {
+    "france": "fr_FR",
+    "germany": "de_DE",
+    "united states": "en_US",
+    "spain": "es_ES",
+    "italy": "it_IT",
+    "japan": "ja_JP",
+    "canada": "en_CA",
+    "united kingdom": "en_GB",
+    "romania": "ro_RO",
+}
+DEFAULT_LOCALE = "en_US"
+
+# Maximum number of Faker instances kept alive by the registry
+MAX_FAKERS = 16
+
+# Value pools: maximum number kept in memory, and eviction limits for pools saved to disk
+MAX_POOLS = 32
+POOL_MAX_AGE = 7 * 24 * 60 * 60  # Seconds
+POOL_MAX_BYTES = 100 * 1024 * 1024
+
+# Upper bound on values drawn per requested pool value when looking for distinct values
+POOL_MAX_DRAWS = 10
+
+# Memory budget of the generated-column cache used by generate_data_cached, evicted least recently used first
+COLUMN_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Uniqueness: consecutive rounds of replacement draws without a new value before a field's constraint
+# space counts as exhausted, and the false-positive rate of the fixed-memory "bloom" mode
+UNIQUE_MAX_RETRIES = 1000
+BLOOM_ERROR_RATE = 0.01
+
+_fakers = OrderedDict()
+_fakers_lock = threading.Lock()
+_pools = OrderedDict()
+_pools_lock = threading.Lock()
+_columns = OrderedDict()
+_columns_lock = threading.Lock()
+_columns_bytes = 0
+
+def resolve_locale(constraint):
+    """
+    Return the Faker locale for a "Country: <name>" constraint, falling back to the default locale.
+    """
+    country = constraint.split(":")[1].strip().lower()
+    return COUNTRY_LOCALES.get(country, DEFAULT_LOCALE)
+
+def get_faker(locale=DEFAULT_LOCALE):
+    """
+    Return the process-wide, unseeded Faker instance for `locale`, creating it on first use.
+    """
+    with _fakers_lock:
+        faker = _fakers.get(locale)
+        if faker is None:
+            from faker import Faker  # Imported lazily to keep start-up fast
+            faker = _fakers[locale] = Faker(locale)
+            if len(_fakers) > MAX_FAKERS:
+                _fakers.popitem(last=False)
+        else:
+            _fakers.move_to_end(locale)
+    return faker
+
+class StringSpace(Sequence):
+    """
+    Every string of `length` characters from `alphabet`, in index order, without building any of them up front.
+    """
+
+    def __init__(self, alphabet, length):
+        self.alphabet = alphabet
+        self.length = length
+
+    def __len__(self):
+        return len(self.alphabet) ** self.length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("StringSpace index out of range")
+        chars = []
+        for _ in range(self.length):
+            index, digit = divmod(index, len(self.alphabet))
+            chars.append(self.alphabet[digit])
+        return "".join(chars)
+
+# Column builders: each returns a callable taking a row count and returning a list of values.
+# `rng` is the `random` module itself for unseeded runs, or a seeded `random.Random` instance.
+# Columns that can only produce a known number of distinct values carry it as `domain_size`,
+# plus the values themselves as `values` when they are cheap to enumerate.
+def finite_column(column, values=None, size=None):
+    column.values = values
+    if size is None:
+        size = len(values) if isinstance(values, range) else len(set(values))
+    column.domain_size = size
+    return column
+
+def choice_column(values, rng=random):
+    values = list(values)
+    return finite_column(lambda n: rng.choices(values, k=n), values)
+
+def constant_column(value):
+    return finite_column(lambda n: [value] * n, [value])
+
+def int_column(min_value, max_value, rng=random):
+    values = range(min_value, max_value + 1)
+    if not values:
+        raise ValueError(f"Invalid range: {min_value}-{max_value}")
+    return finite_column(lambda n: rng.choices(values, k=n), values)
+
+def repeat_column(generator):
+    return lambda n: [generator() for _ in range(n)]
+
+def string_column(min_chars, max_chars, rng=random):
+    letters = string.ascii_letters
+    size = sum(len(letters) ** length for length in range(min_chars, max_chars + 1))
+    values = None
+    if min_chars == max_chars:
+        column = lambda n: ["".join(rng.choices(letters, k=min_chars)) for _ in range(n)]
+        if size <= sys.maxsize:  # len() of larger sequences overflows
+            values = StringSpace(letters, min_chars)  # Fixed-length strings are uniform over this space
+    else:
+        lengths = range(min_chars, max_chars + 1)
+        column = lambda n: ["".join(rng.choices(letters, k=length)) for length in rng.choices(lengths, k=n)]
+    return finite_column(column, values, size)
+
+def field_faker(locale=DEFAULT_LOCALE, rng=random):
+    """
+    Return the shared Faker instance for `locale`, or for reproducible data a new instance seeded from `rng`.
+
+    Seeded instances belong to a single column, so columns compiled in other threads never disturb its stream.
+    """
+    if rng is random:
+        return get_faker(locale)
+
+    from faker import Faker  # Imported lazily to keep start-up fast
+    faker = Faker(locale)
+    faker.seed_instance(rng.getrandbits(64))
+    return faker
+
+def compile_field(constraint, field, rng=random):
+    """
+    Parse constraints and return a column function that generates `n` values meeting the constraints.
+    """
+    # Handle empty or None constraints
+    if not constraint:
+        return default_columns(field, rng)
+
+    constraint = constraint.strip()  # Clean up leading/trailing whitespace
+
+    # Custom logic for specific fields based on constraints
+    if field == "Hobbies":
+        if "sports" in constraint.lower():  # Match case-insensitive substring "sports"
+            sports = ["Football", "Basketball", "Cricket", "Tennis", "Running", "Cycling", "Swimming", "Gymnastics"]
+            return choice_column(sports, rng)
+
+        elif "traveling" in constraint.lower():  # Match case-insensitive substring "traveling"
+            traveling = ["Hiking", "Road trips", "Backpacking", "Cruises", "City tours", "Camping"]
+            return choice_column(traveling, rng)
+
+    elif field == "Age":
+        if constraint.startswith("<") and len(constraint) > 1:
+            max_age = int(constraint[1:].strip())
+            return int_column(0, max_age, rng)
+        elif constraint.startswith(">") and len(constraint) > 1:
+            min_age = int(constraint[1:].strip())
+            return int_column(min_age, 100, rng)
+        elif "-" in constraint:
+            min_age, max_age = map(int, constraint.split("-"))
+            return int_column(min_age, max_age, rng)
+        elif constraint.isdigit():
+            return constant_column(int(constraint))
+
+    elif field == "Gender":
+        return constant_column(constraint.capitalize())
+
+    elif field == "Address" and "Country:" in constraint:
+        # Generate addresses specific to the given country
+        faker = field_faker(resolve_locale(constraint), rng)
+        return repeat_column(lambda: faker.address().replace("\n", ", "))
+
+    elif field == "Phone" and "Country:" in constraint:
+        # Generate phone numbers specific to the given country
+        faker = field_faker(resolve_locale(constraint), rng)
+        return repeat_column(faker.phone_number)
+
+    elif field == "Email":
+        domain = constraint.strip()
+        user_name = field_faker(rng=rng).user_name
+        return repeat_column(lambda: f"{user_name()}@{domain}")
+
+    elif field == "Education":
+        education_levels = [level.strip() for level in constraint.split(",")]
+        return choice_column(education_levels, rng)
+
+    elif field == "Pets":
+        if "dogs" in constraint.lower():  # Match case-insensitive substring "dogs"
+            dog_breeds = [
+                "Labrador Retriever", "German Shepherd", "Golden Retriever", "Bulldog",
+                "Beagle", "Poodle", "Rottweiler", "Dachshund", "Boxer", "Shih Tzu"
+            ]
+            return choice_column(dog_breeds, rng)
+
+        elif "cats" in constraint.lower():  # Match case-insensitive substring "cats"
+            cat_breeds = [
+                "Calico", "Siamese", "British Shorthair", "Main Coon",
+                "Persian Cat", "Ragdoll", "Sphinx", "Scottish Fold",
+            ]
+            return choice_column(cat_breeds, rng)
+
+    elif field == "Random Strings" and "Length:" in constraint:
+        match = re.search(r"Length:\s*(\d+)", constraint)
+        if match:
+            length = int(match.group(1))
+            return string_column(length, length, rng)
+
+    # Fallback to default generator
+    return default_columns(field, rng)
+
+# Default column generators for fields
+def default_columns(field, rng=random):
+    if field == "Hobbies":
+        return choice_column(["Reading", "Painting", "Gardening", "Cooking", "Photography", "Fishing"], rng)
+    elif field == "Age":
+        return int_column(18, 80, rng)  # Default range
+    elif field == "Gender":
+        return choice_column(["Male", "Female", "Non-binary"], rng)
+    elif field == "Address":
+        faker = field_faker(rng=rng)
+        return repeat_column(lambda: faker.address().replace("\n", ", "))
+    elif field == "Phone":
+        return repeat_column(field_faker(rng=rng).phone_number)
+    elif field == "Email":
+        return repeat_column(field_faker(rng=rng).email)
+    elif field == "Education":
+        return choice_column(["High School", "Bachelor", "Master", "PhD"], rng)
+    elif field == "Pets":
+        return choice_column(["Cat", "Dog", "Parrot", "Hamster", "Fish", "Reptile", "Rabbit", "Guinea pig"], rng)
+    elif field == "Random Strings":
+        return string_column(10, 15, rng)
+    else:
+        return constant_column("No valid data")
+
+def parse_constraint(constraint, field):
+    """
+    Parse constraints and return a callable that generates a single value meeting the constraints.
+    """
+    column = compile_field(constraint, field)
+    return lambda: column(1)[0]
+
+# Default generators for fields
+def default_generators(field):
+    column = default_columns(field)
+    return lambda: column(1)[0]
+
+# Value pools: precomputed distinct values that rows are sampled from instead of synthesizing each value
+def build_pool(field, constraint, size, rng=random):
+    """
+    Draw up to `size` distinct values for `field` from its regular generator.
+    """
+    column = compile_field(constraint, field, rng)
+    values = {}
+    draws = 0
+    while len(values) < size and draws < size * POOL_MAX_DRAWS:
+        batch = column(size - len(values))
+        draws += len(batch)
+        values.update(dict.fromkeys(batch))
+    return list(values)
+
+def pool_path(key, directory):
+    digest = hashlib.sha256(json.dumps(key).encode()).hexdigest()[:32]
+    return os.path.join(directory, f"pool_{digest}.json")
+
+def load_pool(key, directory):
+    """
+    Load a saved pool, ignoring (and removing) it once it is older than POOL_MAX_AGE.
+    """
+    path = pool_path(key, directory)
+    try:
+        if time.time() - os.path.getmtime(path) > POOL_MAX_AGE:
+            os.remove(path)
+            return None
+        with open(path, encoding="utf-8") as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return saved["values"] if saved.get("key") == key else None
+
+def save_pool(key, values, directory):
+    """
+    Save a pool to disk, then evict the oldest saved pools beyond POOL_MAX_BYTES.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = pool_path(key, directory)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump({"key": key, "values": values}, f)
+    os.replace(temp_path, path)
+    prune_pools(directory)
+
+def prune_pools(directory, max_bytes=POOL_MAX_BYTES, max_age=POOL_MAX_AGE):
+    """
+    Remove saved pools older than `max_age` seconds, then the oldest ones until the total fits `max_bytes`.
+    """
+    saved = []
+    for name in os.listdir(directory):
+        if name.startswith("pool_") and name.endswith(".json"):
+            path = os.path.join(directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            saved.append((stat.st_mtime, stat.st_size, path))
+
+    saved.sort()
+    total = sum(size for _, size, _ in saved)
+    now = time.time()
+    for mtime, size, path in saved:
+        if total <= max_bytes and now - mtime <= max_age:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+def clear_pool_cache():
+    with _pools_lock:
+        _pools.clear()
+
+def get_pool(field, constraint, size, seed=None, directory=None):
+    """
+    Return the value pool for (field, constraint, size), building it on first use.
+
+    Pools are kept in a bounded in-memory cache and, when `directory` is given,
+    saved there so later runs can skip rebuilding them.
+    """
+    key = [field, (constraint or "").strip(), size, seed]
+    cache_key = json.dumps(key)
+    with _pools_lock:
+        values = _pools.get(cache_key)
+        if values is not None:
+            _pools.move_to_end(cache_key)
+            return values
+
+    values = load_pool(key, directory) if directory else None
+    if values is None:
+        values = build_pool(field, constraint, size, random if seed is None else random.Random(seed))
+        if directory:
+            save_pool(key, values, directory)
+
+    with _pools_lock:
+        _pools[cache_key] = values
+        if len(_pools) > MAX_POOLS:
+            _pools.popitem(last=False)
+    return values
+
+def compile_plan(selected_fields, constraints, rng=random, options=None, pool_seed=None):
+    """
+    Compile the selected fields and their constraints into a list of (field, column) pairs.
+
+    `options` maps a field to its generation options:
+      - "pool": sample values from a precomputed pool of this many distinct values
+      - "pool_dir": directory where the field's pool is saved and reused across runs
+      - "unique": True to never repeat a value, or "bloom" to do so in fixed memory (see `unique_filter`)
+    """
+    options = options or {}
+    plan = []
+    for field in selected_fields:
+        constraint = constraints.get(field, "")
+        field_options = options.get(field, {})
+        if field_options.get("pool"):
+            values = get_pool(field, constraint, field_options["pool"], pool_seed, field_options.get("pool_dir"))
+            plan.append((field, choice_column(values, rng)))
+        else:
+            plan.append((field, compile_field(constraint, field, rng)))
+    return plan
+
+def record_timing(timings, field, seconds, num_values=0):
+    """
+    Add time spent on `field` (and the number of values it produced) to a timings dict.
+    """
+    counters = timings.setdefault(field, {"seconds": 0.0, "values": 0})
+    counters["seconds"] += seconds
+    counters["values"] += num_values
+
+def merge_timings(timings, other):
+    for field, counters in other.items():
+        record_timing(timings, field, counters["seconds"], counters["values"])
+
+def generate_columns(plan, num_rows, timings=None):
+    """
+    Fill every column of the plan with `num_rows` values.
+    """
+    if timings is None:
+        return [column(num_rows) for _, column in plan]
+
+    columns = []
+    for field, column in plan:
+        started = time.perf_counter()
+        columns.append(column(num_rows))
+        record_timing(timings, field, time.perf_counter() - started, num_rows)
+    return columns
+
+def assemble_rows(fields, columns, num_rows):
+    """
+    Zip generated columns into row dicts keyed by field name.
+    """
+    if not columns:
+        return [{} for _ in range(num_rows)]
+    return [dict(zip(fields, values)) for values in zip(*columns)]
+
+def rechunk(chunks, batch_size):
+    """
+    Regroup lists of rows into lists of exactly `batch_size` rows, except possibly the last.
+    """
+    pending = []
+    for chunk in chunks:
+        if not pending and len(chunk) == batch_size:
+            yield chunk
+            continue
+        pending.extend(chunk)
+        start = 0
+        while len(pending) - start >= batch_size:
+            yield pending[start:start + batch_size]
+            start += batch_size
+        pending = pending[start:]
+    if pending:
+        yield pending
+
+def generate_rows(plan, num_rows):
+    """
+    Fill every column of the plan with `num_rows` values and assemble them into row dicts.
+    """
+    fields = [field for field, _ in plan]
+    return assemble_rows(fields, generate_columns(plan, num_rows), num_rows)
+
+def shard_seed(seed, index):
+    """
+    Derive a stable per-shard seed from the master seed and the shard index.
+    """
+    digest = hashlib.sha256(f"{seed}:{index}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+def generate_shard(selected_fields, constraints, num_rows, seed, options=None, pool_seed=None, timings=None):
+    """
+    Generate the columns of a single shard; each field draws from its own generator seeded by
+    (shard seed, field), so a column never depends on which other fields are selected.
+    """
+    columns = []
+    for field in selected_fields:
+        started = time.perf_counter()
+        [(_, column)] = compile_plan([field], constraints, random.Random(shard_seed(seed, field)), options, pool_seed)
+        columns.append(column(num_rows))
+        if timings is not None:
+            record_timing(timings, field, time.perf_counter() - started, num_rows)
+    return columns
+
+def generate_shard_timed(selected_fields, constraints, num_rows, seed, options=None, pool_seed=None):
+    """
+    Generate a shard in a worker process, returning its columns together with their timings.
+    """
+    timings = {}
+    return generate_shard(selected_fields, constraints, num_rows, seed, options, pool_seed, timings), timings
+
+def iter_shards(num_entries, batch_size, seed):
+    """
+    Yield (row count, seed) for each shard; boundaries depend only on `batch_size`, never on worker count.
+    """
+    for index, start in enumerate(range(0, num_entries, batch_size)):
+        yield min(batch_size, num_entries - start), shard_seed(seed, index)
+
+def iter_columns_parallel(
+    selected_fields, constraints, num_entries, batch_size, seed, workers, options=None, timings=None, pool_seed=None
+):
+    """
+    Generate shards across a process pool, yielding their columns in order with a bounded number in flight.
+    """
+    pool = ProcessPoolExecutor(max_workers=workers)
+    pending = deque()
+    task = generate_shard if timings is None else generate_shard_timed
+
+    def result(future):
+        if timings is None:
+            return future.result()
+        columns, shard_timings = future.result()
+        merge_timings(timings, shard_timings)
+        return columns
+
+    try:
+        for num_rows, seed_value in iter_shards(num_entries, batch_size, seed):
+            future = pool.submit(task, selected_fields, constraints, num_rows, seed_value, options, pool_seed)
+            pending.append((num_rows, future))
+            if len(pending) >= workers * 2:
+                num_rows, future = pending.popleft()
+                yield num_rows, result(future)
+
+        while pending:
+            num_rows, future = pending.popleft()
+            yield num_rows, result(future)
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+def iter_columns(
+    selected_fields, constraints, num_entries, batch_size=BATCH_SIZE, seed=None, workers=1, options=None, timings=None
+):
+    """
+    Yield (row count, columns) for each batch of at most `batch_size` rows, in order.
+    """
+    pool_seed = None if seed is None else shard_seed(seed, "pool")
+    if workers > 1:
+        # Unseeded shards still need seeds of their own, but keep sharing the unseeded value pools
+        shard_master_seed = random.getrandbits(64) if seed is None else seed
+        yield from iter_columns_parallel(
+            selected_fields, constraints, num_entries, batch_size, shard_master_seed, workers, options, timings, pool_seed
+        )
+
+    elif seed is not None:
+        for num_rows, seed_value in iter_shards(num_entries, batch_size, seed):
+            yield num_rows, generate_shard(selected_fields, constraints, num_rows, seed_value, options, pool_seed, timings)
+
+    else:
+        plan = []
+        for field in selected_fields:
+            started = time.perf_counter()
+            plan.extend(compile_plan([field], constraints, options=options))
+            if timings is not None:
+                record_timing(timings, field, time.perf_counter() - started)
+
+        for start in range(0, num_entries, batch_size):
+            num_rows = min(batch_size, num_entries - start)
+            yield num_rows, generate_columns(plan, num_rows, timings)
+
+# Uniqueness
+class BloomFilter:
+    """
+    Fixed-size set approximation: membership tests may report false positives but never false negatives.
+    """
+
+    def __init__(self, capacity, error_rate=BLOOM_ERROR_RATE):
+        capacity = max(1, capacity)
+        self.num_bits = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def positions(self, value):
+        digest = hashlib.blake2b(repr(value).encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        step = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * step) % self.num_bits for i in range(self.num_hashes)]
+
+    def __contains__(self, value):
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self.positions(value))
+
+    def add(self, value):
+        for p in self.positions(value):
+            self.bits[p >> 3] |= 1 << (p & 7)
+
+def unique_filter(field, constraint, num_entries, field_options, seed=None, pool_seed=None):
+    """
+    Return a function (column, batch index) -> column that keeps `field` free of repeated values across a run.
+
+    Fields with an enumerable set of values (choices, ranges, pools, fixed-length strings)
+    are sampled without replacement.
+    Other fields replace repeated values with fresh draws, tracking what was seen in an exact set or,
+    with "unique": "bloom", a fixed-size Bloom filter whose false positives only cost an extra draw.
+    Raises ValueError when the constraint cannot produce `num_entries` distinct values.
+    """
+    rng = random if seed is None else random.Random(shard_seed(seed, f"unique:{field}"))
+    [(_, column)] = compile_plan([field], {field: constraint}, rng, {field: field_options}, pool_seed)
+
+    domain_size = getattr(column, "domain_size", None)
+    if domain_size is not None and domain_size < num_entries:
+        raise ValueError(
+            f"Cannot generate {num_entries} unique values for {field}: "
+            f"its constraint only allows {domain_size} distinct values."
+        )
+
+    if getattr(column, "values", None) is not None:
+        distinct = column.values if isinstance(column.values, (range, StringSpace)) else list(dict.fromkeys(column.values))
+        remaining = iter(rng.sample(distinct, num_entries))
+        return lambda values, index: list(islice(remaining, len(values)))
+
+    seen = BloomFilter(num_entries) if field_options["unique"] == "bloom" else set()
+
+    def apply(values, index):
+        values = list(values)
+        missing = []
+        for position, value in enumerate(values):
+            if value in seen:
+                missing.append(position)
+            else:
+                seen.add(value)
+
+        # Replacements come from their own stream so results do not depend on the worker count
+        replacements = None
+        retries = 0
+        while missing and retries < UNIQUE_MAX_RETRIES:
+            if replacements is None:
+                replacement_rng = random if seed is None else random.Random(shard_seed(seed, f"unique:{field}:{index}"))
+                replacements = compile_field(constraint, field, replacement_rng)
+
+            still_missing = []
+            for position, value in zip(missing, replacements(len(missing))):
+                if value in seen:
+                    still_missing.append(position)
+                else:
+                    seen.add(value)
+                    values[position] = value
+            retries = retries + 1 if len(still_missing) == len(missing) else 0
+            missing = still_missing
+
+        if missing:
+            raise ValueError(
+                f"Cannot generate {num_entries} unique values for {field}: no new value found after "
+                f"{UNIQUE_MAX_RETRIES} retries, the constraint space looks exhausted."
+            )
+        return values
+
+    return apply
+
+def iter_data(
+    selected_fields, constraints, num_entries, batch_size=BATCH_SIZE, seed=None, workers=1, options=None, timings=None
+):
+    """
+    Generate test data lazily, yielding lists of at most `batch_size` rows in order.
+
+    Rows are generated in shards of BATCH_SIZE rows and regrouped into batches of `batch_size`.
+    With a `seed`, every shard is drawn from its own generator seeded by (seed, shard index),
+    so the same seed reproduces the same data for any `batch_size`, whether it runs
+    in-process or across `workers` processes.
+    See `compile_plan` for the per-field `options`.
+
+    Pass a dict as `timings` to collect per-field counters while generating:
+    {field: {"seconds": time spent compiling, filling and deduplicating, "values": values produced}}.
+    With workers, seconds are summed across processes.
+    """
+    options = options or {}
+
+    # Uniqueness is enforced here, where batches arrive in order, so it spans every chunk and shard
+    pool_seed = None if seed is None else shard_seed(seed, "pool")
+    filters = [
+        (position, unique_filter(field, constraints.get(field, ""), num_entries, options[field], seed, pool_seed))
+        for position, field in enumerate(selected_fields)
+        if options.get(field, {}).get("unique")
+    ]
+
+    def shards():
+        # Shards have a fixed size so their seeds never depend on the caller's batch size
+        columns_iter = iter_columns(selected_fields, constraints, num_entries, BATCH_SIZE, seed, workers, options, timings)
+        for index, (num_rows, columns) in enumerate(columns_iter):
+            for position, apply in filters:
+                started = time.perf_counter()
+                columns[position] = apply(columns[position], index)
+                if timings is not None:
+                    record_timing(timings, selected_fields[position], time.perf_counter() - started)
+            yield assemble_rows(selected_fields, columns, num_rows)
+
+    yield from rechunk(shards(), batch_size)
+
+# Column cache: generated columns are kept per (field, constraint, seed, options) and resized on demand
+def iter_column(field, constraint, num_entries, seed=None, field_options=None, first_batch=0, batch_size=BATCH_SIZE):
+    """
+    Yield the values of a single column batch by batch, starting at batch index `first_batch`.
+
+    Seeded values are identical to the same column produced by iter_data with the same seed.
+    """
+    field_options = field_options or {}
+    options = {field: field_options}
+    constraints = {field: constraint}
+    pool_seed = None if seed is None else shard_seed(seed, "pool")
+    apply = None
+    if field_options.get("unique"):
+        apply = unique_filter(field, constraint, num_entries, field_options, seed, pool_seed)
+        first_batch = 0  # Uniqueness spans the whole column
+
+    column = None
+    for index, start in enumerate(range(0, num_entries, batch_size)):
+        if index < first_batch:
+            continue
+        num_rows = min(batch_size, num_entries - start)
+        if seed is not None:
+            [values] = generate_shard([field], constraints, num_rows, shard_seed(seed, index), options, pool_seed)
+        else:
+            if column is None:
+                [(_, column)] = compile_plan([field], constraints, options=options)
+            values = column(num_rows)
+        yield apply(values, index) if apply else values
+
+def column_bytes(values):
+    """
+    Estimate the memory held by a column, charging each distinct value object once.
+
+    Choice, range and constant columns repeat a few shared objects, so they cost little more than the list itself.
+    """
+    size = sys.getsizeof(values)
+    sample = values[:1000]
+    if not sample:
+        return size
+
+    if len({id(value) for value in sample}) * 2 > len(sample):
+        # Mostly distinct objects: extrapolate from the sample
+        return size + sum(sys.getsizeof(value) for value in sample) * len(values) // len(sample)
+
+    distinct = {id(value): value for value in values}
+    return size + sum(sys.getsizeof(value) for value in distinct.values())
+
+def column_key(field, constraint, seed=None, field_options=None):
+    return json.dumps(
+        [field, (constraint or "").strip(), seed, field_options or {}, BATCH_SIZE], sort_keys=True, default=str
+    )
+
+def get_column(field, constraint, num_entries, seed=None, field_options=None, progress=None, pinned=()):
+    """
+    Return `num_entries` values for a column, reusing the cached column for the same inputs.
+
+    A cached column of a different length is truncated or extended: whole batches that are
+    unchanged are kept and only the batches from the old/new boundary on are generated,
+    so seeded results match a fresh generate_data run. Unique columns are regenerated when
+    their length changes, since uniqueness spans the whole column. `progress`, if given, is
+    called with the number of values produced after each batch. Columns whose keys are in
+    `pinned` are never evicted to make room for this one.
+    """
+    global _columns_bytes
+    field_options = field_options or {}
+    key = column_key(field, constraint, seed, field_options)
+    with _columns_lock:
+        entry = _columns.get(key)
+        if entry is not None:
+            _columns.move_to_end(key)
+    cached = entry[0] if entry is not None else None
+
+    if cached is not None and len(cached) == num_entries:
+        if progress:
+            progress(num_entries)
+        return cached
+
+    keep = 0
+    if cached is not None and not field_options.get("unique"):
+        keep = min(len(cached), num_entries) // BATCH_SIZE * BATCH_SIZE
+    values = cached[:keep] if keep else []
+    if progress and keep:
+        progress(keep)
+    for chunk in iter_column(field, constraint, num_entries, seed, field_options, keep // BATCH_SIZE, BATCH_SIZE):
+        values.extend(chunk)
+        if progress:
+            progress(len(chunk))
+
+    size = column_bytes(values)
+    with _columns_lock:
+        if key in _columns:
+            _columns_bytes -= _columns.pop(key)[1]
+        _columns[key] = (values, size)
+        _columns_bytes += size
+        for old_key in list(_columns):
+            if _columns_bytes <= COLUMN_CACHE_MAX_BYTES:
+                break
+            if old_key != key and old_key not in pinned:
+                _columns_bytes -= _columns.pop(old_key)[1]
+    return values
+
+def clear_column_cache():
+    global _columns_bytes
+    with _columns_lock:
+        _columns.clear()
+        _columns_bytes = 0
+
+def get_columns(selected_fields, constraints, num_entries, seed=None, options=None, progress=None):
+    """
+    Return one cached column per selected field, computing only those whose inputs changed since earlier calls.
+
+    Columns of the same request never evict each other. See `get_column` for resizing and `progress`.
+    """
+    options = options or {}
+    pinned = {column_key(field, constraints.get(field, ""), seed, options.get(field)) for field in selected_fields}
+    return [
+        get_column(field, constraints.get(field, ""), num_entries, seed, options.get(field), progress, pinned)
+        for field in selected_fields
+    ]
+
+def generate_data_cached(selected_fields, constraints, num_entries, seed=None, options=None, progress=None):
+    """
+    Generate test data like generate_data, but only compute the columns whose inputs changed since earlier calls.
+
+    Changing one field's constraint regenerates that column only, and changing `num_entries`
+    extends or truncates the cached columns. See `get_column` for `progress`.
+    """
+    columns = get_columns(selected_fields, constraints, num_entries, seed, options, progress)
+    return assemble_rows(selected_fields, columns, num_entries)
+
+def iter_rows(
+    selected_fields, constraints, num_entries, batch_size=BATCH_SIZE, seed=None, workers=1, options=None, timings=None
+):
+    """
+    Generate test data lazily, yielding one row at a time.
+    """
+    for chunk in iter_data(selected_fields, constraints, num_entries, batch_size, seed, workers, options, timings):
+        yield from chunk
+
+def generate_data(selected_fields, constraints, num_entries, seed=None, workers=1, options=None, timings=None):
+    """
+    Generate test data based on selected fields and constraints.
+
+    See `iter_data` for `seed`, `workers`, `options` and the `timings` instrumentation hook.
+    """
+    data = []
+    for chunk in iter_data(
+        selected_fields, constraints, num_entries, seed=seed, workers=workers, options=options, timings=timings
+    ):
+        data.extend(chunk)
+
+    return data
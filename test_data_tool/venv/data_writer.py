@@ -0,0 +1,111 @@
+import csv
+import io
+import json
+import queue
+import threading
+
+# Size of the file buffer; encoded chunks are flushed to disk in pieces of roughly this size
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Number of encoded chunks that may wait for the writer thread before the producer blocks
+QUEUE_SIZE = 4
+
+# Encoders: each turns an iterable of row chunks into an iterable of text pieces
+def encode_json(chunks):
+    """
+    Encode rows as a pretty JSON array, byte-identical to json.dump(data, f, indent=4).
+    """
+    first = True
+    for chunk in chunks:
+        if not chunk:
+            continue
+        rows = ["    " + json.dumps(row, indent=4).replace("\n", "\n    ") for row in chunk]
+        yield ("[\n" if first else ",\n") + ",\n".join(rows)
+        first = False
+
+    yield "[]" if first else "\n]"
+
+def encode_ndjson(chunks):
+    """
+    Encode rows as newline-delimited JSON, one object per line.
+    """
+    for chunk in chunks:
+        if chunk:
+            yield "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in chunk)
+
+def encode_csv(chunks, fieldnames):
+    """
+    Encode rows as CSV with a header row built from `fieldnames`.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    writer.writeheader()
+    for chunk in chunks:
+        writer.writerows(chunk)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+FORMATS = ("json", "ndjson", "csv")
+
+def write_data(chunks, path, fmt="json", fieldnames=None):
+    """
+    Stream row chunks to `path` in the given format without holding the whole dataset in memory.
+
+    Encoding happens on the calling thread while a background thread writes to disk,
+    so generation is not stalled by file I/O. Returns the number of rows written.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format: {fmt}")
+    if fmt == "csv" and fieldnames is None:
+        raise ValueError("CSV output requires fieldnames")
+
+    pieces = queue.Queue(maxsize=QUEUE_SIZE)
+    errors = []
+
+    def writer():
+        done = False
+        try:
+            # CSV handles its own line endings; JSON goes through text mode like json.dump
+            newline = "" if fmt == "csv" else None
+            with open(path, "w", encoding="utf-8", newline=newline, buffering=WRITE_BUFFER_SIZE) as f:
+                while (piece := pieces.get()) is not None:
+                    f.write(piece)
+                done = True
+        except Exception as e:
+            errors.append(e)
+            # Keep draining so the producer never blocks on a full queue
+            while not done and pieces.get() is not None:
+                pass
+
+    row_count = 0
+
+    def counted(chunks):
+        nonlocal row_count
+        for chunk in chunks:
+            row_count += len(chunk)
+            yield chunk
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    try:
+        if fmt == "csv":
+            encoded = encode_csv(counted(chunks), fieldnames)
+        elif fmt == "ndjson":
+            encoded = encode_ndjson(counted(chunks))
+        else:
+            encoded = encode_json(counted(chunks))
+        for piece in encoded:
+            if errors:
+                break
+            pieces.put(piece)
+    finally:
+        pieces.put(None)
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return row_count
@@ -0,0 +1,63 @@
+"""
+Offline stand-in for a selenium WebDriver, for exercising DriverPool and fill_forms without a browser.
+
+    from browser_manager import DriverPool, fill_forms
+    from fake_webdriver import FakeWebDriver
+
+    with DriverPool(lambda: FakeWebDriver(delay=0.01, fail_after=50), size=4) as pool:
+        results = fill_forms(rows, "sample_form.html", selectors, pool)
+"""
+import time
+
+class FakeElement:
+    def __init__(self, driver, selector):
+        self.driver = driver
+        self.selector = selector
+        self.value = ""
+
+    def clear(self):
+        self.value = ""
+
+    def send_keys(self, text):
+        self.value += text
+        self.driver.values[self.selector] = self.value
+
+    def click(self):
+        self.driver.submissions.append(dict(self.driver.values))
+
+class FakeWebDriver:
+    """
+    Records what would be typed into the page instead of driving a browser.
+
+    `delay` simulates the time a page load takes, and `fail_after` makes the session
+    crash after that many page loads so recycling can be checked.
+    """
+
+    def __init__(self, delay=0.0, fail_after=None):
+        self.delay = delay
+        self.fail_after = fail_after
+        self.loads = 0
+        self.values = {}
+        self.submissions = []
+        self.closed = False
+
+    def check_alive(self):
+        if self.closed or (self.fail_after is not None and self.loads > self.fail_after):
+            raise RuntimeError("Browser session is no longer responding")
+
+    def get(self, url):
+        self.loads += 1
+        self.check_alive()
+        time.sleep(self.delay)
+        self.values = {}
+
+    def find_element(self, by, selector):
+        self.check_alive()
+        return FakeElement(self, selector)
+
+    def execute_script(self, script):
+        self.check_alive()
+        return "complete"
+
+    def quit(self):
+        self.closed = True
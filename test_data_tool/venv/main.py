@@ -0,0 +1,8 @@
+from ui_manager import launch_ui
+
+def main():
+    # Launch the GUI
+    launch_ui()
+
+if __name__ == "__main__":
+    main()
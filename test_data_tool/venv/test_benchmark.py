@@ -0,0 +1,29 @@
+from benchmark import find_regressions
+
+MB = 1024 * 1024
+
+def result(rows_per_sec, peak_memory_bytes=100 * MB):
+    return {"rows_per_sec": rows_per_sec, "peak_memory_bytes": peak_memory_bytes}
+
+def test_find_regressions_flags_slower_and_bigger_cases():
+    baseline = {
+        "Age x1000": result(1000),
+        "Email x1000": result(1000),
+        "Phone x1000": result(1000),
+    }
+    results = {
+        "Age x1000": result(850, 115 * MB),  # Within tolerance
+        "Email x1000": result(700),
+        "Phone x1000": result(1000, 130 * MB),
+        "Pets x1000": result(1),  # Not in the baseline
+    }
+
+    regressions = find_regressions(results, baseline, tolerance=0.2)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("Email x1000: 700 rows/s, baseline 1,000 rows/s")
+    assert regressions[1] == "Phone x1000: peak memory 130.0 MB, baseline 100.0 MB"
+
+def test_find_regressions_ignores_missing_measurements():
+    baseline = {"Age x1000": {"rows_per_sec": None, "peak_memory_bytes": None}}
+    assert find_regressions({"Age x1000": result(1, None)}, baseline) == []
+    assert find_regressions({"Age x1000": result(10)}, {"Age x1000": result(1000)}, tolerance=0.995) == []
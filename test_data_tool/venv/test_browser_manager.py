@@ -0,0 +1,77 @@
+import pytest
+
+from browser_manager import DriverPool, fill_forms
+from data_generator import generate_data, iter_rows
+from fake_webdriver import FakeWebDriver
+
+FIELDS = ["Age", "Email", "Education"]
+SELECTORS = {"Age": "#age", "Email": "#email", "Education": "#education"}
+URL = "sample_form.html"
+
+def recording_factory(drivers, **kwargs):
+    def factory():
+        driver = FakeWebDriver(**kwargs)
+        drivers.append(driver)
+        return driver
+    return factory
+
+def submitted_rows(drivers):
+    return [submission for driver in drivers for submission in driver.submissions]
+
+def expected_submissions(rows):
+    return [{SELECTORS[field]: str(row[field]) for field in FIELDS} for row in rows]
+
+# Pooled form filling
+@pytest.mark.parametrize("size", [1, 3])
+def test_fill_forms_returns_every_row_in_order(size):
+    drivers = []
+    with DriverPool(recording_factory(drivers, fail_after=3), size=size, max_uses=5) as pool:
+        results = fill_forms(iter_rows(FIELDS, {}, 40, seed=1), URL, SELECTORS, pool, submit_selector="#submit")
+
+    assert [result["row"] for result in results] == list(range(40))
+    assert all(result["ok"] and result["error"] is None for result in results)
+    assert pool.created == len(drivers) <= pool.recycled + size
+    assert all(driver.closed for driver in drivers)
+
+    submissions = submitted_rows(drivers)
+    assert len(submissions) == 40
+    expected = expected_submissions(generate_data(FIELDS, {}, 40, seed=1))
+    assert sorted(submissions, key=str) == sorted(expected, key=str)
+
+def test_sessions_are_recycled_after_max_uses():
+    drivers = []
+    with DriverPool(recording_factory(drivers, fail_after=4), size=1, max_uses=3) as pool:
+        results = fill_forms(iter_rows(FIELDS, {}, 10, seed=2), URL, SELECTORS, pool)
+
+    assert all(result["ok"] and result["attempts"] == 1 for result in results)
+    assert pool.created == 4  # Rows 0-2, 3-5, 6-8 and 9
+    assert pool.recycled == 3
+    assert [driver.loads for driver in drivers] == [3, 3, 3, 1]
+
+def test_crashed_session_is_replaced_and_row_retried():
+    drivers = []
+    with DriverPool(recording_factory(drivers, fail_after=3), size=1, max_uses=100) as pool:
+        results = fill_forms(iter_rows(FIELDS, {}, 10, seed=3), URL, SELECTORS, pool, submit_selector="#submit")
+
+    # Each session fills 3 rows and crashes on the 4th page load, which is retried on a new session
+    assert [result["row"] for result in results] == list(range(10))
+    assert all(result["ok"] for result in results)
+    assert [result["attempts"] for result in results] == [1, 1, 1, 2, 1, 1, 2, 1, 1, 2]
+    assert pool.created == 4
+    assert pool.recycled == 3
+    assert submitted_rows(drivers) == expected_submissions(generate_data(FIELDS, {}, 10, seed=3))
+
+def test_failing_driver_factory_gives_error_results():
+    def factory():
+        raise OSError("chromedriver not found")
+
+    with DriverPool(factory, size=2) as pool:
+        results = fill_forms(iter_rows(FIELDS, {}, 5, seed=4), URL, SELECTORS, pool, retries=2)
+
+    assert [result["row"] for result in results] == list(range(5))
+    for result in results:
+        assert not result["ok"]
+        assert result["error"] == "Could not start browser: chromedriver not found"
+        assert result["attempts"] == 3
+    assert pool.created == 0
+    assert pool.recycled == 0
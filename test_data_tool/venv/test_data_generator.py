@@ -0,0 +1,202 @@
+import os
+import random
+import threading
+import time
+
+import pytest
+
+import data_generator
+from data_generator import generate_data, generate_data_cached
+
+FIELDS = ["Hobbies", "Age", "Phone", "Random Strings"]
+
+@pytest.fixture(autouse=True)
+def empty_column_cache():
+    data_generator.clear_column_cache()
+    yield
+    data_generator.clear_column_cache()
+
+# Seeded generation
+def test_seed_gives_identical_data_for_any_worker_count():
+    num_entries = 2 * data_generator.BATCH_SIZE + 500  # Several shards, the last one partial
+    expected = generate_data(FIELDS, {}, num_entries, seed=42)
+
+    for workers in (2, 3):
+        assert generate_data(FIELDS, {}, num_entries, seed=42, workers=workers) == expected
+
+@pytest.mark.parametrize("batch_size", [700, data_generator.BATCH_SIZE, 25000])
+def test_seed_gives_identical_data_for_any_batch_size(batch_size):
+    num_entries = 2 * data_generator.BATCH_SIZE + 500
+    expected = generate_data(FIELDS, {}, num_entries, seed=9)
+
+    for workers in (1, 2):
+        chunks = list(data_generator.iter_data(FIELDS, {}, num_entries, batch_size, seed=9, workers=workers))
+        assert [len(chunk) for chunk in chunks[:-1]] == [batch_size] * (len(chunks) - 1)
+        assert 0 < len(chunks[-1]) <= batch_size
+        assert [row for chunk in chunks for row in chunk] == expected
+
+def test_different_seeds_give_different_data():
+    assert generate_data(FIELDS, {}, 100, seed=1) != generate_data(FIELDS, {}, 100, seed=2)
+
+def test_cached_generation_matches_generate_data_after_edit_and_resize():
+    constraints = {"Hobbies": "sports", "Phone": "Country: France"}
+    assert generate_data_cached(FIELDS, constraints, 15000, seed=7) == generate_data(FIELDS, constraints, 15000, seed=7)
+
+    # Edit one constraint, then grow and shrink to sizes that do not fall on batch boundaries
+    constraints["Hobbies"] = "traveling"
+    for num_entries in (15000, 25000, 12345):
+        cached = generate_data_cached(FIELDS, constraints, num_entries, seed=7)
+        assert cached == generate_data(FIELDS, constraints, num_entries, seed=7)
+
+def test_concurrent_seeded_runs_match_serial_runs():
+    num_entries = data_generator.BATCH_SIZE + 2000
+    serial = {seed: generate_data(["Address"], {}, num_entries, seed=seed) for seed in (1, 2)}
+
+    concurrent = {}
+
+    def run(seed):
+        concurrent[seed] = generate_data(["Address"], {}, num_entries, seed=seed)
+
+    threads = [threading.Thread(target=run, args=(seed,)) for seed in (1, 2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert concurrent == serial
+
+# Uniqueness
+@pytest.mark.parametrize("field, constraint, field_options", [
+    ("Age", "30-40", {"unique": True}),
+    ("Education", "High School, Bachelor", {"unique": True}),
+    ("Email", "", {"unique": True, "pool": 10}),
+    ("Random Strings", "Length: 1", {"unique": True}),
+])
+def test_unique_raises_up_front_when_domain_is_too_small(field, constraint, field_options):
+    # Far more rows than could be generated quickly, so the check must happen before generating
+    chunks = data_generator.iter_data([field], {field: constraint}, 10 ** 7, options={field: field_options})
+    with pytest.raises(ValueError, match="unique values"):
+        next(chunks)
+
+def test_unique_random_strings_of_length_one_raise_beyond_52_values():
+    options = {"Random Strings": {"unique": True}}
+    assert len(generate_data(["Random Strings"], {"Random Strings": "Length: 1"}, 52, options=options)) == 52
+
+    with pytest.raises(ValueError):
+        generate_data(["Random Strings"], {"Random Strings": "Length: 1"}, 53, options=options)
+
+def test_unique_random_strings_fill_their_whole_domain():
+    num_entries = 52 ** 2
+    constraints = {"Random Strings": "Length: 2"}
+    options = {"Random Strings": {"unique": True}}
+    data = generate_data(["Random Strings"], constraints, num_entries, seed=6, workers=2, options=options)
+
+    assert len({row["Random Strings"] for row in data}) == num_entries
+    assert data == generate_data(["Random Strings"], constraints, num_entries, seed=6, options=options)
+    assert len(generate_data(["Random Strings"], constraints, num_entries, options=options)) == num_entries
+
+@pytest.mark.parametrize("unique", [True, "bloom"])
+def test_unique_email_is_distinct_across_workers(unique):
+    num_entries = data_generator.BATCH_SIZE + 2000
+    options = {"Email": {"unique": unique}}
+    data = generate_data(["Email"], {}, num_entries, seed=3, workers=2, options=options)
+
+    emails = [row["Email"] for row in data]
+    assert len(set(emails)) == num_entries
+    assert data == generate_data(["Email"], {}, num_entries, seed=3, options=options)
+
+def test_unique_finite_domain_uses_every_value_once():
+    options = {"Age": {"unique": True}}
+    data = generate_data(["Age"], {"Age": "30-40"}, 11, seed=5, options=options)
+    assert sorted(row["Age"] for row in data) == list(range(30, 41))
+
+# Value pools
+@pytest.fixture
+def empty_pool_cache():
+    data_generator.clear_pool_cache()
+    yield
+    data_generator.clear_pool_cache()
+
+def saved_pools(directory):
+    return sorted(path.name for path in directory.iterdir() if path.name.startswith("pool_"))
+
+def test_pool_is_reloaded_from_pool_dir(tmp_path, empty_pool_cache, monkeypatch):
+    values = data_generator.get_pool("Email", "", 50, seed=1, directory=str(tmp_path))
+    assert len(saved_pools(tmp_path)) == 1
+
+    data_generator.clear_pool_cache()
+    monkeypatch.setattr(data_generator, "build_pool", lambda *args: pytest.fail("pool was rebuilt"))
+    assert data_generator.get_pool("Email", "", 50, seed=1, directory=str(tmp_path)) == values
+
+def test_saved_pool_expires_after_max_age(tmp_path):
+    key = ["Email", "", 3, None]
+    data_generator.save_pool(key, ["a", "b", "c"], str(tmp_path))
+    assert data_generator.load_pool(key, str(tmp_path)) == ["a", "b", "c"]
+
+    expired = time.time() - data_generator.POOL_MAX_AGE - 60
+    path = data_generator.pool_path(key, str(tmp_path))
+    os.utime(path, (expired, expired))
+    assert data_generator.load_pool(key, str(tmp_path)) is None
+    assert not os.path.exists(path)
+
+def test_prune_pools_evicts_expired_then_oldest_pools(tmp_path):
+    now = time.time()
+    paths = []
+    for age, size in [(100, 5), (50, 5), (10, 5)]:
+        key = ["Email", "", size, age]
+        data_generator.save_pool(key, [str(i) * 100 for i in range(size)], str(tmp_path))
+        path = data_generator.pool_path(key, str(tmp_path))
+        os.utime(path, (now - age, now - age))
+        paths.append(path)
+    newest_two = sum(os.path.getsize(path) for path in paths[1:])
+
+    data_generator.prune_pools(str(tmp_path), max_bytes=newest_two)
+    assert [os.path.exists(path) for path in paths] == [False, True, True]
+
+    data_generator.prune_pools(str(tmp_path), max_age=30)
+    assert [os.path.exists(path) for path in paths] == [False, False, True]
+
+def test_pool_with_seed_and_workers(tmp_path, empty_pool_cache):
+    num_entries = data_generator.BATCH_SIZE + 2000
+    options = {"Email": {"pool": 50, "pool_dir": str(tmp_path)}}
+    data = generate_data(["Email"], {}, num_entries, seed=4, workers=2, options=options)
+
+    assert data == generate_data(["Email"], {}, num_entries, seed=4, options=options)
+    assert len({row["Email"] for row in data}) <= 50
+    assert len(saved_pools(tmp_path)) == 1
+
+def test_unseeded_parallel_runs_share_one_saved_pool(tmp_path, empty_pool_cache):
+    options = {"Email": {"pool": 50, "pool_dir": str(tmp_path)}}
+    emails = set()
+    for _ in range(2):
+        emails.update(row["Email"] for row in generate_data(["Email"], {}, 100, workers=2, options=options))
+
+    assert len(saved_pools(tmp_path)) == 1
+    assert len(emails) <= 50
+
+# Timings
+@pytest.mark.parametrize("seed, workers", [(None, 1), (8, 1), (8, 2)])
+def test_timings_count_values_without_changing_output(seed, workers):
+    from faker import Faker
+
+    num_entries = data_generator.BATCH_SIZE + 2000
+    options = {"Age": {"unique": True}}
+    constraints = {"Age": "0-100000"}
+
+    def run(timings=None):
+        # Unseeded runs draw from the global generators, so start both from the same state
+        random.seed(11)
+        Faker.seed(11)
+        return generate_data(FIELDS, constraints, num_entries, seed=seed, workers=workers, options=options, timings=timings)
+
+    timings = {}
+    assert run(timings) == run()
+    assert sorted(timings) == sorted(FIELDS)
+    for counters in timings.values():
+        assert counters["values"] == num_entries
+        assert counters["seconds"] > 0
+
+def test_merge_timings_adds_counters():
+    timings = {"Age": {"seconds": 1.0, "values": 10}}
+    data_generator.merge_timings(timings, {"Age": {"seconds": 0.5, "values": 5}, "Email": {"seconds": 2.0, "values": 3}})
+    assert timings == {"Age": {"seconds": 1.5, "values": 15}, "Email": {"seconds": 2.0, "values": 3}}
@@ -0,0 +1,115 @@
+import csv
+import json
+import threading
+
+import pytest
+
+import data_writer
+from data_writer import write_data
+
+ROWS = [
+    {"Name": "Zoë", "Age": 31, "Address": "12 rue de l'Église, 75001 Paris", "Tags": ["a", "b"]},
+    {"Name": "Bob", "Age": None, "Address": "1 Main St\nApt 2", "Tags": []},
+    {"Name": "Chloé", "Age": 7, "Address": "", "Tags": ["c"]},
+]
+
+def json_dump_bytes(data, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4)
+    return path.read_bytes()
+
+# JSON
+@pytest.mark.parametrize("chunks", [
+    [],
+    [[]],
+    [ROWS],
+    [ROWS[:1], [], ROWS[1:]],
+    [[row] for row in ROWS],
+])
+def test_json_is_byte_identical_to_json_dump(tmp_path, chunks):
+    data = [row for chunk in chunks for row in chunk]
+    assert write_data(iter(chunks), tmp_path / "out.json") == len(data)
+    assert (tmp_path / "out.json").read_bytes() == json_dump_bytes(data, tmp_path / "expected.json")
+
+# NDJSON and CSV
+def test_ndjson_writes_one_object_per_line(tmp_path):
+    assert write_data([ROWS[:2], [], ROWS[2:]], tmp_path / "out.ndjson", "ndjson") == 3
+
+    text = (tmp_path / "out.ndjson").read_text(encoding="utf-8")
+    assert "Zoë" in text  # Not escaped
+    assert [json.loads(line) for line in text.splitlines()] == ROWS
+
+def test_csv_writes_header_and_rows(tmp_path):
+    fieldnames = ["Name", "Age", "Address"]
+    rows = [{field: row[field] for field in fieldnames} for row in ROWS]
+    assert write_data([rows[:1], [], rows[1:]], tmp_path / "out.csv", "csv", fieldnames) == 3
+
+    with open(tmp_path / "out.csv", encoding="utf-8", newline="") as f:
+        assert f.readline() == "Name,Age,Address\r\n"
+        f.seek(0)
+        written = list(csv.DictReader(f))
+    assert written == [{field: "" if row[field] is None else str(row[field]) for field in fieldnames} for row in rows]
+
+def test_csv_without_rows_writes_only_the_header(tmp_path):
+    assert write_data([], tmp_path / "out.csv", "csv", ["Name"]) == 0
+    assert (tmp_path / "out.csv").read_bytes() == b"Name\r\n"
+
+def test_rejects_bad_arguments(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported format"):
+        write_data([ROWS], tmp_path / "out.xml", "xml")
+    with pytest.raises(ValueError, match="fieldnames"):
+        write_data([ROWS], tmp_path / "out.csv", "csv")
+
+# Writer errors
+class FailingFile:
+    """
+    Text file stand-in that raises on its `fail_on`-th write.
+    """
+
+    def __init__(self, fail_on):
+        self.fail_on = fail_on
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        if self.writes >= self.fail_on:
+            raise OSError("No space left on device")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+def run_with_timeout(target, timeout=10):
+    outcome = {}
+
+    def run():
+        try:
+            outcome["result"] = target()
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "write_data deadlocked"
+    return outcome
+
+@pytest.mark.parametrize("fmt", data_writer.FORMATS)
+def test_writer_error_is_raised_without_deadlock(monkeypatch, fmt):
+    monkeypatch.setattr(data_writer, "open", lambda *args, **kwargs: FailingFile(fail_on=2), raising=False)
+    consumed = []
+
+    def chunks():
+        for index in range(1000):
+            consumed.append(index)
+            yield ROWS
+
+    outcome = run_with_timeout(lambda: write_data(chunks(), "unused", fmt, list(ROWS[0])))
+    assert isinstance(outcome.get("error"), OSError)
+    assert len(consumed) < 1000  # The producer stops soon after the failure
+
+def test_error_opening_the_file_is_raised(tmp_path):
+    outcome = run_with_timeout(lambda: write_data(iter([ROWS] * 100), tmp_path / "missing" / "out.json"))
+    assert isinstance(outcome.get("error"), FileNotFoundError)
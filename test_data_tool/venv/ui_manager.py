@@ -0,0 +1,461 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+from data_generator import assemble_rows, get_columns  # Assume this handles data generation
+from data_writer import write_data
+import math
+import os
+import random
+import threading
+
+OUTPUT_FILE = "generated_data.json"
+
+# Rows written to file per batch in the UI
+UI_BATCH_SIZE = 1000
+
+# Rows shown per page on the third screen
+PAGE_SIZE = 100
+
+# Interval in milliseconds at which the main loop polls the generation worker
+POLL_INTERVAL = 100
+
+class GenerationCancelled(Exception):
+    pass
+
+# Tooltip Class
+class Tooltip:
+    def __init__(self, widget, text):
+        self.widget = widget
+        self.text = text
+        self.tooltip_window = None
+        self.widget.bind("<Enter>", self.show_tooltip)
+        self.widget.bind("<Leave>", self.hide_tooltip)
+
+    def show_tooltip(self, event=None):
+        if self.tooltip_window or not self.text:
+            return
+        x, y, _, _ = self.widget.bbox("insert")
+        x += self.widget.winfo_rootx() + 25
+        y += self.widget.winfo_rooty() + 25
+        self.tooltip_window = tw = tk.Toplevel(self.widget)
+        tw.wm_overrideredirect(True)
+        tw.wm_geometry(f"+{x}+{y}")
+        label = tk.Label(
+            tw, text=self.text, justify="left",
+            background="lightyellow", relief="solid", borderwidth=1,
+            font=("tahoma", "8", "normal")
+        )
+        label.pack(ipadx=1)
+
+    def hide_tooltip(self, event=None):
+        if self.tooltip_window:
+            self.tooltip_window.destroy()
+            self.tooltip_window = None
+
+# Main Application Logic
+def launch_ui():
+    # Variables to store user selections
+    selected_fields = []
+    field_constraints = {}
+
+    # Fixed dimensions for the application window
+    window_width = 500  # Set a fixed width
+    window_height = 400  # Set a fixed height
+
+    placeholder_messages = {
+        "Hobbies": "example: sports, traveling",
+        "Age": "example: <30, >40, 30-40",
+        "Gender": "example: Male, Female, Non-Binary",
+        "Address": "example: Country: Romania",
+        "Phone": "example: Country: Romania",
+        "Email": "example: example.com",
+        "Education": "example: High School, Bachelor, Master, PhD",
+        "Pets": "example: dogs, cats",
+        "Random Strings": "example: Length: 10"
+    }
+
+    # Placeholder handling
+    def apply_placeholder(entry, placeholder):
+        entry.insert(0, placeholder)
+        entry.config(foreground="grey")
+
+        def on_focus_in(event):
+            if entry.get() == placeholder:
+                entry.delete(0, tk.END)
+                entry.config(foreground="black")
+
+        def on_focus_out(event):
+            if not entry.get():
+                entry.insert(0, placeholder)
+                entry.config(foreground="grey")
+
+        entry.bind("<FocusIn>", on_focus_in)
+        entry.bind("<FocusOut>", on_focus_out)
+
+    def show_third_screen(fields, columns, num_rows):
+        # Clear the second screen and switch to the third screen
+        second_screen.pack_forget()
+        center_frame(third_screen)
+        show_screen(second_screen, third_screen)
+
+        # Clear all children of the third screen
+        for widget in third_screen.winfo_children():
+            widget.destroy()
+
+        # Table of the generated rows; only the rows of the current page are read from the columns and inserted
+        table_frame = ttk.Frame(third_screen, width=window_width - 20, height=window_height - 120)
+        table_frame.grid_propagate(False)
+        table_frame.pack(side="top", padx=10, pady=10)
+        table_frame.rowconfigure(0, weight=1)
+        table_frame.columnconfigure(0, weight=1)
+
+        table = ttk.Treeview(table_frame, columns=fields, show="headings")
+        for field in fields:
+            table.heading(field, text=field)
+            table.column(field, width=140, stretch=False)
+
+        y_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=table.yview)
+        x_scrollbar = ttk.Scrollbar(table_frame, orient="horizontal", command=table.xview)
+        table.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
+        table.grid(row=0, column=0, sticky="nsew")
+        y_scrollbar.grid(row=0, column=1, sticky="ns")
+        x_scrollbar.grid(row=1, column=0, sticky="ew")
+
+        # Page navigation: First/Prev/Next/Last, or type a page number and press Enter
+        page_count = max(1, math.ceil(num_rows / PAGE_SIZE))
+        current_page = [0]
+        nav_frame = ttk.Frame(third_screen)
+        nav_frame.pack(side="top")
+        first_button = ttk.Button(nav_frame, text="First", width=5, command=lambda: show_page(0))
+        first_button.grid(row=0, column=0, padx=2)
+        prev_button = ttk.Button(nav_frame, text="Prev", width=5, command=lambda: show_page(current_page[0] - 1))
+        prev_button.grid(row=0, column=1, padx=2)
+        ttk.Label(nav_frame, text="Page").grid(row=0, column=2, padx=(5, 2))
+        page_var = tk.StringVar()
+        page_entry = ttk.Entry(nav_frame, textvariable=page_var, width=7, justify="right")
+        page_entry.grid(row=0, column=3, padx=2)
+        page_entry.bind("<Return>", lambda event: show_entered_page())
+        page_label = ttk.Label(nav_frame, text=f"of {page_count:,} ({num_rows:,} rows)")
+        page_label.grid(row=0, column=4, padx=(2, 5))
+        next_button = ttk.Button(nav_frame, text="Next", width=5, command=lambda: show_page(current_page[0] + 1))
+        next_button.grid(row=0, column=5, padx=2)
+        last_button = ttk.Button(nav_frame, text="Last", width=5, command=lambda: show_page(page_count - 1))
+        last_button.grid(row=0, column=6, padx=2)
+
+        def show_page(page):
+            current_page[0] = page
+            table.delete(*table.get_children())
+            start = page * PAGE_SIZE
+            for index in range(start, min(start + PAGE_SIZE, num_rows)):
+                table.insert("", "end", values=[column[index] for column in columns])
+
+            page_var.set(str(page + 1))
+            for button in (first_button, prev_button):
+                button.config(state=tk.NORMAL if page > 0 else tk.DISABLED)
+            for button in (next_button, last_button):
+                button.config(state=tk.NORMAL if page < page_count - 1 else tk.DISABLED)
+
+        def show_entered_page():
+            try:
+                page = int(page_var.get()) - 1
+            except ValueError:
+                page_var.set(str(current_page[0] + 1))
+                return
+            show_page(min(max(page, 0), page_count - 1))
+
+        show_page(0)
+
+        # "Back" button
+        back_button = ttk.Button(third_screen, text="Back", command=lambda: show_screen(third_screen, second_screen))
+        back_button.pack(side="bottom", padx=10)
+
+        # "Exit" button
+        exit_button = ttk.Button(third_screen, text="Exit", command=root.quit)
+        exit_button.pack(side="bottom", padx=10)
+
+    def show_screen(current, target):
+        # If leaving the third screen, explicitly destroy the canvas and scrollbar
+        if current == third_screen:
+            for widget in current.winfo_children():
+                widget.destroy()
+
+        # Hide the current screen and display the target screen
+        current.pack_forget()
+        target.pack(fill="both", expand=True)
+
+    # Create the main window
+    root = tk.Tk()
+    root.title("Dynamic Test Data Generator")
+    root.geometry(f"{window_width}x{window_height}")  # Set fixed size
+    root.resizable(False, False)  # Disable resizing
+
+    # Helper function to center frames within the fixed width
+    def center_frame(frame):
+        frame.pack(fill="both", expand=True)
+        frame.place(relx=0.5, rely=0.5, anchor="center")
+
+    # All screens
+    first_screen = tk.Frame(root, width=window_width, height=window_height)
+    center_frame(first_screen)
+    second_screen = tk.Frame(root)
+    center_frame(second_screen)
+    third_screen = tk.Frame(root)
+    center_frame(third_screen)
+
+    # Second screen handler
+    def show_second_screen():
+        first_screen.pack_forget()
+        center_frame(second_screen)
+
+        # Collect selected fields
+        selected_fields.clear()
+        for field, var in field_vars.items():
+            if var.get():
+                selected_fields.append(field)
+
+        # Validation: Ensure at least one field is selected
+        if not selected_fields:
+            messagebox.showerror("Error", "At least one field type must be selected.")
+            return
+
+        # Switch to second screen
+        show_screen(first_screen, second_screen)
+
+        # Display constraints inputs
+        for widget in second_screen.winfo_children():
+            widget.destroy()
+
+        row = 0
+        for field in selected_fields:
+            label = ttk.Label(second_screen, text=f"{field} Constraints (optional):")
+            label.grid(row=row, column=0, padx=10, pady=5, sticky="w")
+
+            entry = ttk.Entry(second_screen, width=40)
+            entry.grid(row=row, column=1, padx=10, pady=5)
+            constraint_entries[field] = entry
+
+            apply_placeholder(entry, placeholder_messages.get(field, "Enter constraints if any"))
+            row += 1
+
+        # Seed of this session: the same seed and inputs give the same data, "New Seed" draws fresh data
+        seed_label = ttk.Label(second_screen, text="Seed:")
+        seed_label.grid(row=row, column=0, padx=10, pady=5, sticky="w")
+        seed_frame = ttk.Frame(second_screen)
+        seed_frame.grid(row=row, column=1, padx=10, pady=5, sticky="w")
+        seed_entry = ttk.Entry(seed_frame, textvariable=seed_var, width=28)
+        seed_entry.pack(side="left")
+        new_seed_button = ttk.Button(seed_frame, text="New Seed", command=draw_seed)
+        new_seed_button.pack(side="left", padx=(5, 0))
+        Tooltip(new_seed_button, "Draw a new seed to generate fresh data.")
+        row += 1
+
+        # Back Button
+        back_button = ttk.Button(second_screen, text="Back", command=lambda: show_screen(second_screen, first_screen))
+        back_button.grid(row=row, column=0, columnspan=2, pady=10)
+
+        # Generate Data Button
+        generate_button = ttk.Button(second_screen, text="Generate Data", command=generate)
+        generate_button.grid(row=row + 1, column=0, columnspan=2, pady=10)
+        second_screen_buttons[:] = [back_button, generate_button, new_seed_button]
+
+    # First screen handler
+    first_screen.pack(fill="both", expand=True)
+
+    field_vars = {field: tk.BooleanVar() for field in placeholder_messages.keys()}
+    constraint_entries = {}
+    second_screen_buttons = []
+    seed_var = tk.StringVar()
+
+    def draw_seed():
+        seed_var.set(str(random.getrandbits(32)))
+
+    draw_seed()
+
+    # Field selection frame
+    field_frame = ttk.LabelFrame(first_screen, text="Select Field Types", width=window_width)
+    field_frame.grid(row=0, column=0, padx=10, pady=10, sticky="w")
+
+    # Add "Select All" Checkbox
+    select_all_var = tk.BooleanVar()
+
+    def toggle_select_all():
+        # Set all checkboxes to the same state as "Select All"
+        state = select_all_var.get()
+        for var in field_vars.values():
+            var.set(state)
+        validate_next_button()  # Update the "Next" button state
+
+    def update_select_all():
+        # Update "Select All" checkbox based on individual checkboxes
+        if all(var.get() for var in field_vars.values()):
+            select_all_var.set(True)
+        elif any(var.get() for var in field_vars.values()):
+            select_all_var.set(False)
+        else:
+            select_all_var.set(False)
+        validate_next_button()  # Update the "Next" button state
+
+    # Add the "Select All" checkbox
+    select_all_checkbox = ttk.Checkbutton(
+        field_frame, text="Select All", variable=select_all_var, command=toggle_select_all
+    )
+    select_all_checkbox.grid(row=0, column=0, sticky="w", padx=5, pady=5)
+
+    # Add individual field checkboxes below "Select All"
+    for idx, field in enumerate(placeholder_messages.keys(), start=1):
+        checkbox=ttk.Checkbutton(
+            field_frame,
+            text=field,
+            variable=field_vars[field],
+            command=lambda: [update_select_all(), validate_next_button()] # Ensure "Select All"/"Next" is updated on individual changes
+        )
+        checkbox.grid(row=idx, column=0, sticky="w", padx=5, pady=2)
+
+    # Number of entries
+    num_entries_label = ttk.Label(first_screen, text="Number of Entries:")
+    num_entries_label.grid(row=1, column=0, padx=10, pady=5, sticky="w")
+    num_entries_entry = ttk.Entry(first_screen, width=40)
+    num_entries_entry.grid(row=1, column=1, padx=10, pady=5, sticky="w")
+
+    # Set the default value of 5
+    num_entries_entry.insert(0, "5")  # Set the default value as 5
+
+    # Next button to proceed to second screen
+    next_button = ttk.Button(first_screen, text="Next", command=show_second_screen, state=tk.DISABLED)
+    next_button.grid(row=2, column=0, columnspan=2, pady=10)
+
+    # Create the tooltip for the "Next" button
+    tooltip = Tooltip(next_button, "Enter a positive integer to enable the button.")
+
+    # Function to validate and enable/disable the Next button
+    def validate_next_button():
+        try:
+            # Validate the number of entries
+            value = int(num_entries_entry.get())  # Get the value entered by the user
+            is_positive_integer = value > 0
+        except ValueError:
+            is_positive_integer = False
+
+        # Check if at least one checkbox is selected
+        is_field_selected = any(var.get() for var in field_vars.values())
+
+        # Update "Next" button state based on both conditions
+        if is_field_selected and is_positive_integer:
+            next_button.config(state=tk.NORMAL)
+            tooltip.text = ""  # Clear the tooltip message when the button is enabled
+        else:
+            next_button.config(state=tk.DISABLED)
+            if not is_field_selected:
+                tooltip.text = "At least one field type must be selected."
+            elif not is_positive_integer:
+                tooltip.text = "Enter a positive integer to enable the button."
+
+    # Bind validation function to the entry widget
+    num_entries_entry.bind("<KeyRelease>", lambda event: validate_next_button())  # Trigger on each key release
+
+    # Call validate_next_button to enable/disable the Next button based on the default value
+    validate_next_button()  # Check if the default value is valid and enable the button if it is
+    
+    # Data generation
+    def generate():
+        try:
+            # Validate number of entries
+            num_entries = int(num_entries_entry.get())
+            if num_entries <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid positive integer for the number of entries.")
+            return
+
+        try:
+            seed = int(seed_var.get())
+        except ValueError:
+            messagebox.showerror("Error", "Please enter an integer seed, or press New Seed to draw one.")
+            return
+
+        # Collect constraints
+        field_constraints.clear()
+        for field in selected_fields:
+            entry = constraint_entries[field]
+            content = entry.get().strip()
+            placeholder = placeholder_messages.get(field, "Enter constraints if any")
+            field_constraints[field] = None if content == placeholder or not content else content
+
+        # Generate once in a background worker; the columns kept for the preview are the ones saved to file.
+        # Columns whose field, constraint, seed and row count are unchanged since the last run are reused.
+        fields = list(selected_fields)
+        constraints = dict(field_constraints)
+        columns = []
+        total = num_entries * len(fields) + num_entries  # Generated values, then written rows
+        state = {"done": 0, "error": None, "cancelled": False}
+        cancel_event = threading.Event()
+        temp_file = f"{OUTPUT_FILE}.tmp"
+
+        def report(count):
+            if cancel_event.is_set():
+                raise GenerationCancelled
+            state["done"] += count
+
+        def chunks():
+            # Row dicts are built one batch at a time while writing
+            for start in range(0, num_entries, UI_BATCH_SIZE):
+                num_rows = min(UI_BATCH_SIZE, num_entries - start)
+                report(num_rows)
+                yield assemble_rows(fields, [column[start:start + num_rows] for column in columns], num_rows)
+
+        def worker():
+            try:
+                columns.extend(get_columns(fields, constraints, num_entries, seed, progress=report))
+                write_data(chunks(), temp_file)
+                os.replace(temp_file, OUTPUT_FILE)
+            except GenerationCancelled:
+                state["cancelled"] = True
+            except Exception as e:
+                state["error"] = e
+            finally:
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+
+        # Progress bar and Cancel button, shown below the second screen buttons while generating
+        next_row = second_screen.grid_size()[1]
+        progress_bar = ttk.Progressbar(second_screen, maximum=total, length=300)
+        progress_bar.grid(row=next_row, column=0, columnspan=2, pady=5)
+        progress_label = ttk.Label(second_screen, text="0%")
+        progress_label.grid(row=next_row + 1, column=0, columnspan=2)
+        cancel_button = ttk.Button(second_screen, text="Cancel", command=cancel_event.set)
+        cancel_button.grid(row=next_row + 2, column=0, columnspan=2, pady=5)
+        for button in second_screen_buttons:
+            button.config(state=tk.DISABLED)
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+
+        def poll():
+            progress_bar["value"] = state["done"]
+            progress_label.config(text=f"{100 * state['done'] // total}%")
+            if thread.is_alive():
+                root.after(POLL_INTERVAL, poll)
+                return
+
+            for widget in (progress_bar, progress_label, cancel_button):
+                widget.destroy()
+            for button in second_screen_buttons:
+                button.config(state=tk.NORMAL)
+
+            if state["error"] is not None:
+                messagebox.showerror("Error", f"An error occurred: {state['error']}")
+            elif state["cancelled"]:
+                messagebox.showinfo("Cancelled", "Data generation was cancelled.")
+            else:
+                show_third_screen(fields, columns, num_entries)
+                messagebox.showinfo(
+                    "Success", f"Test data generated successfully with seed {seed}! Saved as '{OUTPUT_FILE}'."
+                )
+
+        root.after(POLL_INTERVAL, poll)
+
+    def show_first_screen():
+        # Switch to the first screen
+        second_screen.pack_forget()
+        center_frame(first_screen)
+
+    root.mainloop()